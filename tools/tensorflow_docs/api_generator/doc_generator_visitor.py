@@ -15,11 +15,10 @@
 """A `traverse` visitor for processing documentation."""
 
 import collections
-import dataclasses
 import enum
 import inspect
 
-from typing import Any, Dict, List, Optional, NamedTuple, Tuple
+from typing import Any, Dict, Iterator, List, Optional, NamedTuple, Tuple
 
 from tensorflow_docs.api_generator import obj_type as obj_type_lib
 
@@ -52,10 +51,12 @@ def maybe_singleton(py_object: Any) -> bool:
   return is_immutable_type or (isinstance(py_object, tuple) and py_object == ())  # pylint: disable=g-explicit-bool-comparison
 
 
-@dataclasses.dataclass
 class PathTreeNode(object):
   """Represents a path to an object in the API, an object can have many paths.
 
+  There is one of these for every path in the API, so it uses `__slots__` to
+  keep the per-node overhead down.
+
   Attributes:
     path: A tuple of strings containing the path to the object from the root
       like `('tf', 'losses', 'hinge')`
@@ -66,10 +67,27 @@ class PathTreeNode(object):
     short_name: The last path component
     full_name: All path components joined with "."
   """
+  __slots__ = ('path', 'py_object', 'parent', 'children', 'full_name')
+
   path: ApiPath
   py_object: Any
   parent: Optional['PathTreeNode']
-  children: Dict[str, 'PathTreeNode'] = dataclasses.field(default_factory=dict)
+  children: Dict[str, 'PathTreeNode']
+  full_name: str
+
+  def __init__(self,
+               path: ApiPath,
+               py_object: Any,
+               parent: Optional['PathTreeNode'],
+               children: Optional[Dict[str, 'PathTreeNode']] = None):
+    self.path = path
+    self.py_object = py_object
+    self.parent = parent
+    if children is None:
+      children = {}
+    self.children = children
+    # Names are compared and looked up constantly, join the path only once.
+    self.full_name = '.'.join(path)
 
   def __hash__(self):
     return id(self)
@@ -86,10 +104,6 @@ class PathTreeNode(object):
   def short_name(self) -> str:
     return self.path[-1]
 
-  @property
-  def full_name(self) -> str:
-    return '.'.join(self.path)
-
 
 class PathTree(Dict[ApiPath, PathTreeNode]):
   """An index/tree of all object-paths in the API.
@@ -106,6 +120,9 @@ class PathTree(Dict[ApiPath, PathTreeNode]):
     super().__setitem__((), root)
 
     self.root: PathTreeNode = root
+    # Keyed by `id()`. Each node keeps its `py_object` alive, so an id can't be
+    # reused while the tree exists, and plain id-keyed dicts (this one, and the
+    # visitor's `reverse_index`) need no weakrefs.
     self._nodes_for_id: Dict[int, List[PathTreeNode]] = (
         collections.defaultdict(list))
 
@@ -141,12 +158,12 @@ class PathTree(Dict[ApiPath, PathTreeNode]):
       # We cannot use the duplicate mechanism for some constants, since e.g.,
       # id(c1) == id(c2) with c1=1, c2=1. This isn't problematic since constants
       # have no usable docstring and won't be documented automatically.
-      nodes = self.nodes_for_obj(obj)
-      nodes.append(node)
+      self._nodes_for_id[id(obj)].append(node)
     parent.children[node.short_name] = node
 
   def nodes_for_obj(self, py_object) -> List[PathTreeNode]:
-    return self._nodes_for_id[id(py_object)]
+    # Use `.get` so lookups (e.g. for singletons) don't add empty entries.
+    return self._nodes_for_id.get(id(py_object), [])
 
 
 class DocGeneratorVisitor(object):
@@ -180,6 +197,7 @@ class DocGeneratorVisitor(object):
     self._reverse_index: Dict[int, str] = None
     self._duplicates: Dict[str, List[str]] = None
     self._duplicate_of: Dict[str, str] = None
+    self._name_scores: Dict[ApiPath, 'DocGeneratorVisitor.NameScore'] = {}
 
     self.path_tree = PathTree()
     self.api_tree = None
@@ -274,7 +292,9 @@ class DocGeneratorVisitor(object):
     """
     parent_name = '.'.join(parent_path)
     self._index[parent_name] = parent
-    self._tree[parent_name] = []
+    # Each parent is only visited once, so fill its list in place rather than
+    # looking it up in `_tree` for every child.
+    child_names = self._tree[parent_name] = []
     if parent_path not in self.path_tree:
       self.path_tree[parent_path] = parent
 
@@ -286,9 +306,9 @@ class DocGeneratorVisitor(object):
       child_path = parent_path + (name,)
       self.path_tree[child_path] = child
 
-      full_name = '.'.join([parent_name, name]) if parent_name else name
+      full_name = self.path_tree[child_path].full_name
       self._index[full_name] = child
-      self._tree[parent_name].append(name)
+      child_names.append(name)
 
     return children
 
@@ -321,12 +341,23 @@ class DocGeneratorVisitor(object):
       A tuple of scores. When sorted the preferred name will have the lowest
       value.
     """
-    py_object = self.path_tree[path].py_object
+    # Each path is scored once by `_resolve_duplicates`, and again by
+    # `ApiTree.from_path_tree`; the cache saves the second scoring.
+    score = self._name_scores.get(path)
+    if score is None:
+      score = self._compute_name_score(path)
+      self._name_scores[path] = score
+    return score
+
+  def _compute_name_score(self, path: ApiPath) -> NameScore:
+    """Computes the `_score_name` for `path`, without caching."""
+    node = self.path_tree[path]
+    py_object = node.py_object
     if len(path) == 1:
       return self.NameScore(-99, -99, -99, -99, path)
 
     short_name = path[-1]
-    container = self.path_tree[path[:-1]].py_object
+    container = node.parent.py_object
 
     defining_class_score = 1
     if inspect.isclass(container):
@@ -335,7 +366,9 @@ class DocGeneratorVisitor(object):
         defining_class_score = -1
 
     experimental_score = -1
-    if 'contrib' in path or any('experimental' in part for part in path):
+    # A substring search of the cached full name is equivalent to checking each
+    # part, since "experimental" can't span a ".".
+    if 'contrib' in path or 'experimental' in node.full_name:
       experimental_score = 1
 
     keras_score = 1
@@ -346,7 +379,7 @@ class DocGeneratorVisitor(object):
       # prefer short paths for modules
       module_length_score = len(path)
     else:
-      module_length_score = self._get_module_length_score(path)
+      module_length_score = self._get_module_length_score(node)
 
     return self.NameScore(
         defining_class_score=defining_class_score,
@@ -355,15 +388,13 @@ class DocGeneratorVisitor(object):
         module_length_score=module_length_score,
         path=path)
 
-  def _get_module_length_score(self, path):
-    partial_path = list(path)
-    while partial_path:
-      container = self.path_tree[tuple(partial_path[:-1])].py_object
-      partial_path.pop()
-      if inspect.ismodule(container):
-        break
+  def _get_module_length_score(self, node: PathTreeNode) -> int:
+    # Follow the parent links up to the closest enclosing module.
+    container = node.parent
+    while container is not None and not inspect.ismodule(container.py_object):
+      container = container.parent
 
-    module_length = len(partial_path)
+    module_length = len(container.path) if container is not None else 0
 
     if module_length == 2:
       # `tf.submodule.thing` is better than `tf.thing`
@@ -393,10 +424,22 @@ class DocGeneratorVisitor(object):
 
     self.api_tree = ApiTree.from_path_tree(self.path_tree, self._score_name)
 
-    # Maps the id of a symbol to its fully qualified name. For symbols that have
-    # several aliases, this map contains the first one found.
-    # We use id(py_object) to get a hashable value for py_object. Note all
-    # objects in _index are in memory at the same time so this is safe.
+    duplicates, duplicate_of, reverse_index = self._resolve_duplicates()
+
+    self._duplicate_of = duplicate_of
+    self._duplicates = duplicates
+    self._reverse_index = reverse_index
+
+  def _resolve_duplicates(
+      self) -> Tuple[Dict[str, List[str]], Dict[str, str], Dict[int, str]]:
+    """Chooses main names, and indexes the aliases, in one pass over the tree.
+
+    Returns:
+      A `(duplicates, duplicate_of, reverse_index)` tuple, see the properties
+      with those names for details.
+    """
+    # Maps the id of a symbol to its main name.
+    # We use id(py_object) to get a hashable value for py_object.
     reverse_index = {}
 
     # Decide on main names, rewire duplicates and make a duplicate_of map
@@ -411,45 +454,56 @@ class DocGeneratorVisitor(object):
     for path, node in self.path_tree.items():
       if not path:
         continue
-      full_name = node.full_name
       py_object = node.py_object
       object_id = id(py_object)
-      if full_name in duplicates:
+      # Every alias of an object is resolved when the first one is reached, so
+      # skip the rest of the group instead of re-scoring it.
+      if object_id in reverse_index:
         continue
 
       aliases = self.path_tree.nodes_for_obj(py_object)
-      # maybe_singleton types can't be looked up by object.
-      if not aliases:
+      # maybe_singleton types can't be looked up by object, each of their paths
+      # is handled on its own, and never enters the `reverse_index`.
+      is_singleton = not aliases
+      if is_singleton:
         aliases = [node]
 
-      name_tuples = [alias.path for alias in aliases]
-
       # Choose the main name with a lexical sort on the tuples returned by
       # by _score_name.
-      main_name_tuple = min(name_tuples, key=self._score_name)
-      main_name = '.'.join(main_name_tuple)
+      main_name = min(
+          aliases, key=lambda alias: self._score_name(alias.path)).full_name
 
-      names = ['.'.join(name_tuple) for name_tuple in name_tuples]
-      if name_tuples:
-        duplicates[main_name] = sorted(names)
+      names = [alias.full_name for alias in aliases]
+      duplicates[main_name] = sorted(names)
 
       for name in names:
         if name != main_name:
           duplicate_of[name] = main_name
 
-      # Set the reverse index to the canonical name.
-      if not maybe_singleton(py_object):
+      # Set the reverse index to the canonical name, once per object.
+      if not is_singleton:
         reverse_index[object_id] = main_name
 
-    self._duplicate_of = duplicate_of
-    self._duplicates = duplicates
-    self._reverse_index = reverse_index
+    return duplicates, duplicate_of, reverse_index
 
 
-@dataclasses.dataclass(repr=False)
 class ApiTreeNode(PathTreeNode):
   """A node in the ApiTree."""
-  aliases: List[ApiPath] = dataclasses.field(default_factory=list)
+  __slots__ = ('aliases',)
+
+  aliases: List[ApiPath]
+
+  def __init__(self,
+               path: ApiPath,
+               py_object: Any,
+               parent: Optional[PathTreeNode],
+               children: Optional[Dict[str, PathTreeNode]] = None,
+               aliases: Optional[List[ApiPath]] = None):
+    super().__init__(
+        path=path, py_object=py_object, parent=parent, children=children)
+    if aliases is None:
+      aliases = []
+    self.aliases = aliases
 
   @property
   def obj_type(self) -> obj_type_lib.ObjType:
@@ -507,8 +561,8 @@ class ApiTree(Dict[ApiPath, ApiTreeNode]):
         path=(), py_object=None, parent=None, aliases=[()])  # type: ignore
     self.root = root
     super().__setitem__((), root)
-    self._nodes = []
-    self._node_for_object = {}
+    self._nodes: List[ApiTreeNode] = []
+    self._node_for_object: Dict[int, ApiTreeNode] = {}
 
   def __eq__(self, other):
     raise ValueError("Don't try to compare these")
@@ -522,13 +576,16 @@ class ApiTree(Dict[ApiPath, ApiTreeNode]):
     # TODO(b/184563451): remove
     return super().__contains__(path)
 
-  def iter_nodes(self):
-    """Iterate over the nodes in BFS order."""
-    stack = collections.deque([self.root])
-    while stack:
-      children = list(stack.popleft().children.values())
-      yield from children
-      stack.extend(children)
+  def iter_nodes(self) -> Iterator[ApiTreeNode]:
+    """Iterate over the nodes in insertion order (parents before children).
+
+    Each node is returned once, even though it can be reached by several
+    aliases.
+
+    Returns:
+      An iterator over the nodes of the tree, excluding the root.
+    """
+    return iter(self._nodes)
 
   def __setitem__(self, *args, **kwargs):
     raise TypeError('Use .insert instead of setitem []')
@@ -580,18 +637,21 @@ class ApiTree(Dict[ApiPath, ApiTreeNode]):
       # Add the current node in case it's a singelton.
       duplicate_nodes.add(current_node)
 
-      parents = [node.parent for node in duplicate_nodes]
+      # Aliases often share a parent (`Class.a`, `Class.b`), only check and
+      # queue each parent once.
+      unprocessed_parents = [
+          parent for parent in dict.fromkeys(
+              node.parent for node in duplicate_nodes)
+          if parent.path not in self
+      ]
 
       # Choose the master name with a lexical sort on the tuples returned by
       # by _score_name.
-      if not all(parent.path in self for parent in parents):
+      if unprocessed_parents:
         # rewind
         active_nodes.appendleft(current_node)
         # do each duplicate's immediate parents first.
-        for parent in parents:
-          if parent.path in self:
-            continue
-          active_nodes.appendleft(parent)
+        active_nodes.extendleft(unprocessed_parents)
         continue
       # If we've made it here, the immediate parents of each of the paths have
       # been processed, so now we can choose its master name.
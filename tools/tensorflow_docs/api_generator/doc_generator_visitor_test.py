@@ -17,6 +17,7 @@
 import argparse
 import inspect
 import io
+import operator
 import os
 import textwrap
 import types
@@ -33,7 +34,7 @@ class NoDunderVisitor(doc_generator_visitor.DocGeneratorVisitor):
   def __call__(self, parent_name, parent, children):
     """Drop all the dunder methods to make testing easier."""
     children = [
-        (name, obj) for (name, obj) in children if not name.startswith('_')
+        (name, obj) for (name, obj) in children if name[:1] != '_'
     ]
     return super(NoDunderVisitor, self).__call__(parent_name, parent, children)
 
@@ -413,8 +414,8 @@ class ApiTreeTest(absltest.TestCase):
         py_object=tf.Parent,
         aliases=[('tf', 'Parent'), ('tf', 'Parent2')])
 
-    result = sorted(result.iter_nodes(), key=lambda node: node.path)
-    expected = sorted(expected.iter_nodes(), key=lambda node: node.path)
+    result = sorted(result.iter_nodes(), key=operator.attrgetter('path'))
+    expected = sorted(expected.iter_nodes(), key=operator.attrgetter('path'))
 
     # Circular references make it hard to compare trees or nodes.
     for e, r in zip(result, expected):
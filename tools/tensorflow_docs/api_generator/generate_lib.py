@@ -15,6 +15,7 @@
 """Generate tensorflow.org style API Reference docs for a Python module."""
 
 import collections
+import operator
 import os
 import pathlib
 import shutil
@@ -187,7 +188,7 @@ def write_docs(
 
   if redirects and gen_redirects:
     redirects_dict = {
-        'redirects': sorted(redirects, key=lambda redirect: redirect['from'])
+        'redirects': sorted(redirects, key=operator.itemgetter('from'))
     }
 
     api_redirects_path = output_dir / root_module_name / '_redirects.yaml'
@@ -224,8 +225,8 @@ def extract(py_modules,
   Args:
     py_modules: A list containing a single (short_name, module_object) pair.
       like `[('tf',tf)]`.
-    base_dir: The package root directory. Nothing defined outside of this
-      directory is documented.
+    base_dir: The package root directory, or a tuple of them. Nothing defined
+      outside of these directories is documented.
     private_map: A {'path':["name"]} dictionary listing particular object
       locations that should be ignored in the doc generator.
     visitor_cls: A class, typically a subclass of
@@ -246,6 +247,13 @@ def extract(py_modules,
     raise ValueError("only pass one [('name',module)] pair in py_modules")
   short_name, py_module = py_modules[0]
 
+  # Convert to `Path`s once, up front. `PublicAPIFilter` compares these against
+  # the parents of every module's `__file__`; a bare string would be iterated
+  # character by character there.
+  if isinstance(base_dir, (str, pathlib.Path)):
+    base_dir = (base_dir,)
+  base_dir = tuple(pathlib.Path(d) for d in base_dir)
+
   api_filter = public_api.PublicAPIFilter(
       base_dir=base_dir,
       private_map=private_map)
@@ -146,6 +146,21 @@ class GenerateTest(absltest.TestCase):
     # Make sure that duplicates are not written
     self.assertTrue((output_dir / 'tf/TestModule/test_function.md').exists())
 
+  def test_extract_str_base_dir(self):
+    tf = types.ModuleType('tf')
+    tf.__file__ = '/tmp/tf/__init__.py'
+    tf.inside = types.ModuleType('inside')
+    tf.inside.__file__ = '/tmp/tf/inside.py'
+    tf.outside = types.ModuleType('outside')
+    tf.outside.__file__ = '/tmp/other/outside.py'
+
+    visitor = generate_lib.extract([('tf', tf)],
+                                   base_dir='/tmp/tf',
+                                   private_map={})
+
+    self.assertIn('tf.inside', visitor.index)
+    self.assertNotIn('tf.outside', visitor.index)
+
 
 if __name__ == '__main__':
   absltest.main()
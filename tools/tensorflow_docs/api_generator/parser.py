@@ -17,6 +17,7 @@
 import dataclasses
 import enum
 import inspect
+import operator
 import pathlib
 import posixpath
 import pprint
@@ -727,7 +728,7 @@ def generate_global_index(library_name, index, reference_resolver):
   # Sort all the symbols once, so that the ordering is preserved when its broken
   # up into main symbols and compat symbols and sorting the sublists is not
   # required.
-  symbol_links = sorted(symbol_links, key=lambda x: x[0])
+  symbol_links = sorted(symbol_links, key=operator.itemgetter(0))
 
   compat_v1_symbol_links = []
   compat_v2_symbol_links = []
@@ -16,6 +16,7 @@
 import collections
 import dataclasses
 import itertools
+import operator
 import re
 import textwrap
 from typing import Any, Dict, List, NamedTuple, Optional
@@ -288,7 +289,7 @@ class ClassPageInfo(base_page.PageInfo):
   @property
   def classes(self):
     """Returns a list of `base_page.MemberInfo` pointing to any nested classes."""
-    return sorted(self._classes, key=lambda x: x.short_name)
+    return sorted(self._classes, key=operator.attrgetter('short_name'))
 
   def get_metadata_html(self) -> str:
     meta_data = parser.Metadata(self.full_name)
@@ -161,9 +161,11 @@ class Toc(Entry):
       yield stream
 
   def write(self, file: Union[os.PathLike, IO[str]]) -> None:
+    # The yaml emitter writes many small fragments, collect them in memory and
+    # write the result with a single call.
+    text = yaml.dump(self, default_flow_style=False, Dumper=_TocDumper)
     with self._maybe_open(file) as stream:
-      yaml.dump(
-          self, stream=stream, default_flow_style=False, Dumper=_TocDumper)
+      stream.write(text)
 
 
 class TocBuilder:
@@ -213,8 +215,8 @@ class TocBuilder:
     entries = []
     for child in api_node.children.values():
       entries.extend(self._entries_from_api_node(child))
-    entries = sorted(entries, key=self._section_order_key)
-    entries = [overview] + entries
+    entries.sort(key=self._section_order_key)
+    entries.insert(0, overview)
 
     status = self._make_status(api_node)
     return Section(
@@ -234,14 +236,19 @@ class TocBuilder:
                           api_node: doc_generator_visitor.ApiTreeNode,
                           title: Optional[str] = None) -> List[Entry]:
     """Returns entries for both `Class` and `Class.Nested`."""
-    title = title or api_node.short_name
-    entries = [self._make_link(api_node, title=title)]
-    for name, child_node in api_node.children.items():
-      if child_node.obj_type in [
-          obj_type_lib.ObjType.CLASS, obj_type_lib.ObjType.MODULE
-      ]:
-        subtitle = f'{title}.{name}'
-        entries.extend(self._flat_class_entries(child_node, title=subtitle))
+    entries = []
+    # Depth-first, pre-order, with an explicit stack.
+    stack = [(api_node, title or api_node.short_name)]
+    while stack:
+      node, node_title = stack.pop()
+      entries.append(self._make_link(node, title=node_title))
+      nested = [(child_node, f'{node_title}.{name}')
+                for name, child_node in node.children.items()
+                if child_node.obj_type in [
+                    obj_type_lib.ObjType.CLASS, obj_type_lib.ObjType.MODULE
+                ]]
+      # Reversed, so they're popped in their original order.
+      stack.extend(reversed(nested))
 
     return entries
 
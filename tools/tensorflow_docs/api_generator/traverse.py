@@ -14,6 +14,7 @@
 # ==============================================================================
 """Traversing Python modules and classes."""
 import inspect
+import operator
 import sys
 
 from google.protobuf.message import Message as ProtoMessage
@@ -111,7 +112,7 @@ def _add_proto_fields(path, root, children):
 
   children = dict(children)
   children.update(field_properties)
-  children = sorted(children.items(), key=lambda item: item[0])
+  children = sorted(children.items(), key=operator.itemgetter(0))
 
   return children
 